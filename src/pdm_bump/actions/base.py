@@ -138,7 +138,8 @@ class VersionModifier(VersionConsumer):
     @classmethod
     def get_allowed_arguments(cls) -> set[str]:
         """"""
-        return {"persister"}.union(VersionConsumer.get_allowed_arguments())
+        # Cooperative, so that mixed in vcs consumers add their arguments
+        return {"persister"}.union(super().get_allowed_arguments())
 
     def __str__(self) -> str:
         return self.__class__.__name__.replace(VersionModifier.__name__, "")
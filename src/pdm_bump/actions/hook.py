@@ -13,7 +13,7 @@
 
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import TYPE_CHECKING, ClassVar, Protocol
+from typing import TYPE_CHECKING, ClassVar, Optional, Protocol
 
 from pdm_pfsc.config import MissingValue
 from pdm_pfsc.hook import HookBase, HookExecutorBase
@@ -151,27 +151,26 @@ class HookExecutor(HookExecutorBase[tuple[_Executable, Version]]):
 
         """
         (executor, version) = context
+        run_hooks: bool = not dry_run and len(self._hooks) > 0
 
-        pre_call_ctx: "PreHookContext" = PreHookContext(
-            self.__vcs_provider, version
-        )
-
-        if not dry_run:
+        if run_hooks:
+            pre_call_ctx: "PreHookContext" = PreHookContext(
+                self.__vcs_provider, version
+            )
             for hook in self._hooks:
                 hook.pre_action_hook(pre_call_ctx, args)
 
         old_version = version
         version = executor.run(dry_run)
 
-        post_call_ctx: "PostHookContext" = PostHookContext(
-            self.__vcs_provider,
-            self.__hunk_source,
-            version,
-            old_version,
-            old_version != version,
-        )
-
-        if not dry_run:
+        if run_hooks:
+            post_call_ctx: "PostHookContext" = PostHookContext(
+                self.__vcs_provider,
+                self.__hunk_source,
+                version,
+                old_version,
+                old_version != version,
+            )
             for hook in self._hooks:
                 hook.post_action_hook(post_call_ctx, args)
 
@@ -182,6 +181,11 @@ class CommitChanges(HookBase):
     default_commit_message: "ClassVar[str]" = COMMIT_MESSAGE_TEMPLATE_DEFAULT
     perform_commit: "ClassVar[bool]" = PERFORM_COMMIT_DEFAULT
 
+    _commit_default: "ClassVar[MissingValue]" = MissingValue(perform_commit)
+    _message_default: "ClassVar[MissingValue]" = MissingValue(
+        default_commit_message
+    )
+
     @traced_function
     def post_action_hook(
         self, context: "PostHookContext", args: "Namespace"
@@ -251,7 +255,7 @@ class CommitChanges(HookBase):
             "--commit",
             "-c",
             action="store_true",
-            default=MissingValue(CommitChanges.perform_commit),
+            default=cls._commit_default,
             help="Commit changes to repository. Uses configuration value "
             "'perform_commit' to store default action.",
         )
@@ -261,7 +265,7 @@ class CommitChanges(HookBase):
             "-m",
             dest="commit_message",
             action="store",
-            default=MissingValue(CommitChanges.default_commit_message),
+            default=cls._message_default,
             help="The commit message template. May contain "
             "{from} and {to} as format identifier. Uses configuration value "
             "'commit_msg_tmpl' as configured default value.",
@@ -275,6 +279,15 @@ class TagChanges(HookBase):
     allow_dirty: "ClassVar[bool]" = ALLOW_DIRTY_DEFAULT
     prepend_to_tag: "ClassVar[bool]" = TAG_ADD_PREFIX_DEFAULT
 
+    _tag_default: "ClassVar[MissingValue]" = MissingValue(do_tag)
+    _dirty_default: "ClassVar[MissingValue]" = MissingValue(allow_dirty)
+    _prepend_default: "ClassVar[MissingValue]" = MissingValue(prepend_to_tag)
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+        self.__resolved_flags: "Optional[tuple[bool, bool, bool]]" = None
+
     @traced_function
     def post_action_hook(
         self, context: "PostHookContext", args: "Namespace"
@@ -296,8 +309,10 @@ class TagChanges(HookBase):
         if not context.version_changed:
             return
 
-        tag_repo = _str_as_bool(kwargs.pop("tag", self.do_tag))
-        must_be_clean = not _str_as_bool(kwargs.pop("dirty", self.allow_dirty))
+        tag_repo, allow_dirty, prepend_letter_v = self._resolve_flags(args)
+        kwargs.pop("tag", None)
+        kwargs.pop("dirty", None)
+        must_be_clean = not allow_dirty
         is_dirty = not context.vcs_provider.is_clean
 
         if tag_repo:
@@ -311,11 +326,9 @@ class TagChanges(HookBase):
                     "The repository is not clean. Performing tag anyway."
                 )
 
+            kwargs.pop("prepend_letter_v", None)
             context.vcs_provider.create_tag_from_version(
-                context.version,
-                _str_as_bool(
-                    kwargs.pop("prepend_letter_v", self.prepend_to_tag)
-                ),
+                context.version, prepend_letter_v
             )
 
     @traced_function
@@ -335,14 +348,34 @@ class TagChanges(HookBase):
         --------
 
         """
-        kwargs = vars(args)
-        if (
-            _str_as_bool(kwargs.get("tag", self.do_tag))
-            and not _str_as_bool(kwargs.get("dirty", self.allow_dirty))
-            and not context.vcs_provider.is_clean
-        ):
+        tag_repo, allow_dirty, _ = self._resolve_flags(args)
+        if tag_repo and not allow_dirty and not context.vcs_provider.is_clean:
             raise RuntimeError("Repository root is not clean")
 
+    def _resolve_flags(self, args: "Namespace") -> "tuple[bool, bool, bool]":
+        """
+
+        Parameters:
+        -----------
+
+            args: Namespace :
+
+        Returns:
+        --------
+
+        """
+        if self.__resolved_flags is None:
+            kwargs = vars(args)
+            self.__resolved_flags = (
+                _str_as_bool(kwargs.get("tag", self.do_tag)),
+                _str_as_bool(kwargs.get("dirty", self.allow_dirty)),
+                _str_as_bool(
+                    kwargs.get("prepend_letter_v", self.prepend_to_tag)
+                ),
+            )
+
+        return self.__resolved_flags
+
     @classmethod
     @traced_function
     def configure(cls, parser: "ArgumentParser") -> None:
@@ -359,7 +392,7 @@ class TagChanges(HookBase):
             "--tag",
             "-t",
             action="store_true",
-            default=MissingValue(TagChanges.do_tag),
+            default=cls._tag_default,
             help="Create a tag after modifying the current version. Uses "
             "configuration value 'auto_tag' to store its default value.",
         )
@@ -368,7 +401,7 @@ class TagChanges(HookBase):
             "--dirty",
             "-d",
             action="store_true",
-            default=MissingValue(TagChanges.allow_dirty),
+            default=cls._dirty_default,
             help="Create a tag, even if the repository is dirty. Uses "
             "configuration value 'allow_dirty' to store its "
             "default value.",
@@ -378,7 +411,7 @@ class TagChanges(HookBase):
             "--no-prepend-v",
             dest="prepend_letter_v",
             action="store_false",
-            default=MissingValue(TagChanges.prepend_to_tag),
+            default=cls._prepend_default,
             help="Do not prepend letter v for the tag. Uses "
             "configuration value 'tag_add_prefix' to store its "
             "default value.",
@@ -15,7 +15,8 @@
 import sys
 from abc import abstractmethod
 from dataclasses import asdict as dataclass_to_dict
-from typing import TYPE_CHECKING, Any, Final, final
+from dataclasses import replace as dataclass_replace
+from typing import TYPE_CHECKING, Any, Final, Literal, final
 
 from pdm_pfsc.logging import logger, traced_function
 
@@ -33,6 +34,10 @@ if TYPE_CHECKING:
 
 _formatter = Pep440VersionFormatter()
 
+_DEV_ONE: 'Final[tuple[Literal["dev"], NonNegativeInteger]]' = ("dev", 1)
+_POST_ONE: 'Final[tuple[Literal["post"], NonNegativeInteger]]' = ("post", 1)
+_DEFAULT_VERSION: "Final[Version]" = Version.default()
+
 
 class _NonFinalPartsRemovingVersionModifier(VersionModifier):
     """"""
@@ -298,22 +303,19 @@ class EpochIncrementingVersionModifier(_NonFinalPartsRemovingVersionModifier):
     @traced_function
     def create_new_version(self) -> "Version":
         """"""
-        constructional_args: dict[str, Any] = dataclass_to_dict(
-            self.current_version
-        )
+        base_version: "Version" = self.current_version
+        changes: dict[str, Any] = {}
 
         if self.__reset_version or self.remove_non_final_parts:
-            constructional_args = dataclass_to_dict(Version.default())
+            base_version = _DEFAULT_VERSION
             if not self.__reset_version:
                 logger.debug("Current version tuple shall not be reset")
-                constructional_args["release_tuple"] = (
-                    self.current_version.release
-                )
+                changes["release_tuple"] = self.current_version.release
 
         logger.debug("Incrementing Epoch of version")
-        constructional_args["epoch"] = self.current_version.epoch + 1
+        changes["epoch"] = self.current_version.epoch + 1
 
-        next_version: "Version" = Version(**constructional_args)
+        next_version: "Version" = dataclass_replace(base_version, **changes)
         self._report_new_version(next_version)
         return next_version
 
@@ -352,13 +354,13 @@ class DevelopmentVersionIncrementingVersionModifier(VersionModifier):
     @traced_function
     def create_new_version(self) -> "Version":
         """"""
-        dev_version: "NonNegativeInteger" = 1
+        dev: 'tuple[Literal["dev"], NonNegativeInteger]' = _DEV_ONE
         micro_version = self.current_version.micro
         pre = None
         if self.current_version.dev is not None:
             _, dev_version = self.current_version.dev
             logger.debug("Incrementing development version part by one")
-            dev_version = dev_version + 1
+            dev = ("dev", dev_version + 1)
         elif self.current_version.preview is not None:
             logger.debug("Incrementing preview version as this is a preview")
             pre = (
@@ -371,26 +373,27 @@ class DevelopmentVersionIncrementingVersionModifier(VersionModifier):
             )
             micro_version = micro_version + 1
 
-        constructional_args: dict[str, Any] = dataclass_to_dict(
-            self.current_version
-        )
-        constructional_args["dev"] = ("dev", dev_version)
-        constructional_args["release_tuple"] = (
-            self.current_version.major,
-            self.current_version.minor,
-            micro_version,
-        )
+        changes: dict[str, Any] = {
+            "dev": dev,
+            "release_tuple": (
+                self.current_version.major,
+                self.current_version.minor,
+                micro_version,
+            ),
+        }
         if pre is not None:
-            constructional_args["preview"] = pre
+            changes["preview"] = pre
 
         if (
             self.current_version.is_post_release
             and not self.current_version.is_development_version
         ):
             logger.debug("Resetting post version to zero")
-            constructional_args["post"] = None
+            changes["post"] = None
 
-        next_version: Version = Version(**constructional_args)
+        next_version: Version = dataclass_replace(
+            self.current_version, **changes
+        )
         self._report_new_version(next_version)
 
         return next_version
@@ -407,20 +410,19 @@ class PostVersionIncrementingVersionModifier(VersionModifier):
     @traced_function
     def create_new_version(self) -> "Version":
         """"""
-        post_version: "NonNegativeInteger" = 1
+        post: 'tuple[Literal["post"], NonNegativeInteger]' = _POST_ONE
         if self.current_version.post is not None:
             _, post_version = self.current_version.post
             logger.debug("Incrementing post version part by one")
-            post_version = post_version + 1
+            post = ("post", post_version + 1)
 
-        constructional_args: dict[str, Any] = dataclass_to_dict(
-            self.current_version
-        )
-        constructional_args["post"] = ("post", post_version)
+        changes: dict[str, Any] = {"post": post}
         if self.current_version.is_development_version:
-            constructional_args["dev"] = None
+            changes["dev"] = None
 
-        next_version: "Version" = Version(**constructional_args)
+        next_version: "Version" = dataclass_replace(
+            self.current_version, **changes
+        )
         self._report_new_version(next_version)
 
         return next_version
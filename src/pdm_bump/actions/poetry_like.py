@@ -11,7 +11,7 @@
 #
 """"""
 
-from typing import Literal, Optional, final
+from typing import Final, Literal, Optional, final
 
 from pdm_pfsc.logging import logger, traced_function
 
@@ -21,6 +21,8 @@ from .base import VersionModifier, action
 # Comparable functions at poetry. Cf.
 # https://python-poetry.org/docs/cli/#version
 
+_ALPHA_ZERO: 'Final[tuple[Literal["a"], int]]' = ("a", 0)
+
 
 @final
 @action
@@ -45,12 +47,11 @@ class PoetryLikePreMajorVersionModifier(VersionModifier):
 
         major_version = self.current_version.major + 1
         release_part = (major_version, 0, 0)
-        alpha_part = 0
 
         next_version: Version = Version(
             epoch=self.current_version.epoch,
             release_tuple=release_part,
-            preview=("a", alpha_part),
+            preview=_ALPHA_ZERO,
             dev=None,
             local=None,
             post=None,
@@ -82,12 +83,11 @@ class PoetryLikePreMinorVersionModifier(VersionModifier):
 
         minor_version = self.current_version.minor + 1
         release_part = (self.current_version.major, minor_version, 0)
-        alpha_part = 0
 
         next_version: Version = Version(
             epoch=self.current_version.epoch,
             release_tuple=release_part,
-            preview=("a", alpha_part),
+            preview=_ALPHA_ZERO,
             dev=None,
             local=None,
             post=None,
@@ -123,12 +123,11 @@ class PoetryLikePrePatchVersionModifier(VersionModifier):
             self.current_version.minor,
             micro_version,
         )
-        alpha_part = 0
 
         next_version: Version = Version(
             epoch=self.current_version.epoch,
             release_tuple=release_part,
-            preview=("a", alpha_part),
+            preview=_ALPHA_ZERO,
             dev=None,
             local=None,
             post=None,
@@ -167,7 +166,7 @@ class PoetryLikePreReleaseVersionModifier(VersionModifier):
             elif self.current_version.is_release_candidate:
                 preview_part = ("rc", self.current_version.preview[1] + 1)
         else:
-            preview_part = ("a", 0)
+            preview_part = _ALPHA_ZERO
             release_part = (
                 self.current_version.major,
                 self.current_version.minor,
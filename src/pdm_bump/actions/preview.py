@@ -13,7 +13,15 @@
 
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Literal, Optional, cast, final
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Final,
+    Literal,
+    Optional,
+    cast,
+    final,
+)
 
 from pdm_pfsc.logging import logger, traced_function
 
@@ -53,9 +61,16 @@ class _DummyPersister:  # pylint: disable=R0903
         raise NotImplementedError()
 
 
+_DUMMY_PERSISTER: "Final[_DummyPersister]" = _DummyPersister()
+
+
 class _PreReleaseIncrementingVersionModifier(VersionModifier):
     """"""
 
+    pre_release_part: ClassVar[
+        tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]
+    ]
+
     def __init__(
         self,
         version: "Version",
@@ -109,17 +124,20 @@ class _PreReleaseIncrementingVersionModifier(VersionModifier):
         pre: tuple[
             Literal["a", "b", "c", "alpha", "beta", "rc"], NonNegativeInteger
         ] = (letter, 1)
+        current: "Version" = self.current_version
+        preview = current.preview
 
+        # Version.__str__ formats lazily, only if debug output is enabled
         logger.debug(
             "Incrementing %s part of current version %s",
             name,
-            _formatter.format(self.current_version),
+            current,
         )
 
-        if self.current_version.preview is not None:
+        if preview is not None:
             if not self._is_valid_preview_version():
                 raise PreviewMismatchError(
-                    f"{_formatter.format(self.current_version)} "
+                    f"{_formatter.format(current)} "
                     # Weird behavior of sonarlint, pylint and flake8
                     # Variable is declared as unused, if used only in
                     # formatted string
@@ -133,14 +151,14 @@ class _PreReleaseIncrementingVersionModifier(VersionModifier):
                 "'alpha', 'beta', 'rc'],"
                 "NonNegativeInteger,"
                 "]",
-                self.current_version.preview,
+                preview,
             )
             number = pre[1] + 1 if letter == pre[0] else 1
 
             pre = (letter, number)
 
         result: "Version" = Version(
-            self.current_version.epoch,
+            current.epoch,
             self._get_next_release(),
             pre,
             None,
@@ -152,14 +170,6 @@ class _PreReleaseIncrementingVersionModifier(VersionModifier):
 
         return result
 
-    @property
-    @abstractmethod
-    def pre_release_part(
-        self,
-    ) -> tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]:
-        """"""
-        raise NotImplementedError()
-
     @abstractmethod
     def _is_valid_preview_version(self) -> bool:
         """"""
@@ -167,20 +177,12 @@ class _PreReleaseIncrementingVersionModifier(VersionModifier):
 
     def _get_next_release(self) -> "tuple[NonNegativeInteger, ...]":
         """"""
-        micro = self.current_version.micro
+        # Version.release always provides major, minor and micro
+        major, minor, micro = self.current_version.release
         if self.__increment_micro and self.current_version.preview is None:
             micro = micro + 1
 
-        ret: "list[NonNegativeInteger]" = []
-        for val in self.current_version.release:
-            ret.append(val)
-
-        while len(ret) < 3:
-            ret.append(0)
-
-        ret[2] = micro
-
-        return tuple(ret)
+        return (major, minor, micro)
 
 
 @final
@@ -219,35 +221,18 @@ class PreReleaseIncrementingVersionModifier(VersionModifier):
                 else AlphaIncrementingVersionModifier.name
             )
 
-        self.__sub_modifier: VersionModifier
-        if (
-            pre_release_part in (AlphaIncrementingVersionModifier.name,)
-            or pre_release_part in AlphaIncrementingVersionModifier.aliases
-        ):
-            self.__sub_modifier = AlphaIncrementingVersionModifier(
-                version, _DummyPersister(), do_increment_micro
-            )
-        elif (
-            pre_release_part in (BetaIncrementingVersionModifier.name,)
-            or pre_release_part in BetaIncrementingVersionModifier.aliases
-        ):
-            self.__sub_modifier = BetaIncrementingVersionModifier(
-                version, _DummyPersister(), do_increment_micro
-            )
-        elif (
-            pre_release_part
-            in (ReleaseCandidateIncrementingVersionModifier.name,)
-            or pre_release_part
-            in ReleaseCandidateIncrementingVersionModifier.aliases
-        ):
-            self.__sub_modifier = ReleaseCandidateIncrementingVersionModifier(
-                version, _DummyPersister(), do_increment_micro
-            )
-        else:
+        sub_modifier_type: (
+            "Optional[type[_PreReleaseIncrementingVersionModifier]]"
+        ) = _PRE_DISPATCH.get(pre_release_part)
+        if sub_modifier_type is None:
             raise ValueError(
                 f"{pre_release_part} is not a valid pre-release part"
             )
 
+        self.__sub_modifier: VersionModifier = sub_modifier_type(
+            version, _DUMMY_PERSISTER, do_increment_micro
+        )
+
     @traced_function
     def create_new_version(self) -> "Version":
         """"""
@@ -266,20 +251,12 @@ class PreReleaseIncrementingVersionModifier(VersionModifier):
         -------
 
         """
-        valid_values = []
-        valid_values.append(AlphaIncrementingVersionModifier.name)
-        valid_values.append(BetaIncrementingVersionModifier.name)
-        valid_values.append(ReleaseCandidateIncrementingVersionModifier.name)
-        valid_values.extend(
-            ReleaseCandidateIncrementingVersionModifier.aliases
-        )
-
         sub_parser.add_argument(
             "--pre",
             action="store",
             type=str,
             default=None,
-            choices=valid_values,
+            choices=_PRE_CHOICES,
             dest="pre_release_part",
             help="Sets a pre-release on the current version."
             + " If a pre-release is set, it can be removed "
@@ -300,13 +277,9 @@ class AlphaIncrementingVersionModifier(_PreReleaseIncrementingVersionModifier):
     name: str = "alpha"
     aliases: tuple[str] = ("a",)
     description: str = "Increment the alpha pre-release version part"
-
-    @property
-    def pre_release_part(
-        self,
-    ) -> tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]:
-        """"""
-        return ("a", "alpha")
+    pre_release_part: ClassVar[
+        tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]
+    ] = ("a", "alpha")
 
     def _is_valid_preview_version(self) -> bool:
         """"""
@@ -320,17 +293,14 @@ class BetaIncrementingVersionModifier(_PreReleaseIncrementingVersionModifier):
     name: str = "beta"
     aliases: tuple[str] = ("b",)
     description: str = "Increment the beta pre-release version part"
-
-    @property
-    def pre_release_part(
-        self,
-    ) -> tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]:
-        """"""
-        return ("b", "alpha or beta")
+    pre_release_part: ClassVar[
+        tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]
+    ] = ("b", "alpha or beta")
 
     def _is_valid_preview_version(self) -> bool:
         """"""
-        return self.current_version.is_alpha or self.current_version.is_beta
+        current = self.current_version
+        return current.is_alpha or current.is_beta
 
 
 @final
@@ -344,18 +314,35 @@ class ReleaseCandidateIncrementingVersionModifier(
         "Increment the release-candidate pre-release version part"
     )
     aliases: tuple[str] = ("c",)
-
-    @property
-    def pre_release_part(
-        self,
-    ) -> tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]:
-        """"""
-        return ("rc", "pre-release")
+    pre_release_part: ClassVar[
+        tuple[Literal["a", "b", "c", "alpha", "beta", "rc"], str]
+    ] = ("rc", "pre-release")
 
     def _is_valid_preview_version(self) -> bool:
         """"""
+        current = self.current_version
         return (
-            self.current_version.is_alpha
-            or self.current_version.is_beta
-            or self.current_version.is_release_candidate
+            current.is_alpha
+            or current.is_beta
+            or current.is_release_candidate
         )
+
+
+_PRE_DISPATCH: (
+    "Final[dict[str, type[_PreReleaseIncrementingVersionModifier]]]"
+) = {
+    key: modifier_type
+    for modifier_type in (
+        AlphaIncrementingVersionModifier,
+        BetaIncrementingVersionModifier,
+        ReleaseCandidateIncrementingVersionModifier,
+    )
+    for key in (modifier_type.name, *modifier_type.aliases)
+}
+
+_PRE_CHOICES: "Final[tuple[str, ...]]" = (
+    AlphaIncrementingVersionModifier.name,
+    BetaIncrementingVersionModifier.name,
+    ReleaseCandidateIncrementingVersionModifier.name,
+    *ReleaseCandidateIncrementingVersionModifier.aliases,
+)
@@ -12,16 +12,14 @@
 """"""
 
 
-from abc import abstractmethod
 from functools import cached_property
-from typing import Optional, final
+from typing import Final, Optional, final
 
-from pdm_pfsc.logging import logger, silenced
+from pdm_pfsc.logging import logger
 
 from ..core.version import Pep440VersionFormatter, Version
 from ..vcs import (
     CommitStatistics,
-    CommitType,
     History,
     VcsProvider,
     VcsProviderAggregator,
@@ -29,21 +27,37 @@ from ..vcs import (
 from .base import VersionConsumer, VersionModifier, VersionPersister, action
 from .version_providers import SemanticVersionPolicy, VersionPolicy
 
+_formatter = Pep440VersionFormatter()
+_DEFAULT_POLICY: "Final[type[SemanticVersionPolicy]]" = SemanticVersionPolicy
+_VCS_CONSUMER_ARGUMENTS: "Final[frozenset[str]]" = frozenset(
+    {"vcs_provider"}
+).union(VersionConsumer.get_allowed_arguments())
+
+
+class _VcsVersionConsumer(VcsProviderAggregator, VersionConsumer):
+    """"""
+
+    def __init__(
+        self, version: Version, vcs_provider: VcsProvider, **kwargs
+    ) -> None:
+        """"""
+        super().__init__(version=version, vcs_provider=vcs_provider, **kwargs)
+
+    @classmethod
+    def get_allowed_arguments(cls) -> set[str]:
+        """"""
+        # Return a copy, so that callers cannot alter the shared arguments
+        return set(_VCS_CONSUMER_ARGUMENTS)
+
 
 @final
 @action
-class CreateTagFromVersion(VersionConsumer, VcsProviderAggregator):
+class CreateTagFromVersion(_VcsVersionConsumer):
     """"""
 
     name: str = "tag"
     description: str = "Create a VCS revision tag from the current version"
 
-    def __init__(
-        self, version: Version, vcs_provider: VcsProvider, **kwargs
-    ) -> None:
-        VersionConsumer.__init__(self, version, **kwargs)
-        VcsProviderAggregator.__init__(self, vcs_provider, **kwargs)
-
     def run(self, dry_run: bool = False) -> Version:
         """
 
@@ -61,34 +75,15 @@ class CreateTagFromVersion(VersionConsumer, VcsProviderAggregator):
         else:
             logger.info(
                 "Would create tag v%s",
-                Pep440VersionFormatter().format(self.current_version),
+                _formatter.format(self.current_version),
             )
 
         return self.current_version
 
-    @classmethod
-    def get_allowed_arguments(cls) -> set[str]:
-        """"""
-        return {"vcs_provider"}.union(VersionConsumer.get_allowed_arguments())
 
-
-class _VcsVersionDerivatingVersionConsumer(
-    VersionConsumer, VcsProviderAggregator
-):
+class _VcsVersionDerivatingVersionConsumer(_VcsVersionConsumer):
     """"""
 
-    def __init__(
-        self, version: Version, vcs_provider: VcsProvider, **kwargs
-    ) -> None:
-        """"""
-        VersionConsumer.__init__(self, version, **kwargs)
-        VcsProviderAggregator.__init__(self, vcs_provider, **kwargs)
-
-    @classmethod
-    def get_allowed_arguments(cls) -> set[str]:
-        """"""
-        return {"vcs_provider"}.union(VersionConsumer.get_allowed_arguments())
-
     def save_version(self, _: Version) -> None:
         """"""
         # This does not persist anything
@@ -99,9 +94,7 @@ class _VcsVersionDerivatingVersionConsumer(
         history: History = self.vcs_provider.get_history()
         stats: CommitStatistics = history.get_commit_stats
 
-        keys: frozenset[CommitType] = frozenset(stats.commit_type_count.keys())
-
-        if len(keys) == 0:
+        if not stats.commit_type_count:
             logger.info("History clean. No need to update version")
             return None
 
@@ -109,15 +102,18 @@ class _VcsVersionDerivatingVersionConsumer(
             stats, self.vcs_provider.is_clean
         )
 
-        with silenced(logger):
-            new_version: Version = modifier.create_new_version()
-            return new_version
+        # The modifier would report an increment that is not performed
+        was_disabled: bool = logger.disabled
+        logger.disabled = True
+        try:
+            return modifier.create_new_version()
+        finally:
+            logger.disabled = was_disabled
 
-    @property
-    @abstractmethod
+    @cached_property
     def _version_policy(self) -> VersionPolicy:
         """"""
-        raise NotImplementedError()
+        return _DEFAULT_POLICY(self.current_version)
 
 
 @final
@@ -133,15 +129,11 @@ class SuggestNewVersion(_VcsVersionDerivatingVersionConsumer):
         logger.debug("Ignoring dry run parameter set to %s", dry_run)
         new_version: Optional[Version] = self.derive_next_version()
         if new_version is not None:
-            next_version: str = Pep440VersionFormatter().format(new_version)
+            next_version: str = _formatter.format(new_version)
             logger.info("Would suggest new version: %s", next_version)
 
         return new_version or self.current_version
 
-    @cached_property
-    def _version_policy(self) -> VersionPolicy:
-        return SemanticVersionPolicy(self.current_version)
-
 
 @final
 @action
@@ -162,13 +154,10 @@ class AutoSelectVersionModifier(
         **kwargs,
     ) -> None:
         """"""
-        # For unknown reasons, the modifier complains
-        # about a missing vcs_provider argument
-        VersionModifier.__init__(
-            self, version, persister, vcs_provider=vcs_provider, **kwargs
-        )
-        _VcsVersionDerivatingVersionConsumer.__init__(
-            self, version, vcs_provider, **kwargs
+        # VersionModifier passes on to the vcs consumer in the MRO,
+        # which requires the vcs_provider argument
+        super().__init__(
+            version, persister, vcs_provider=vcs_provider, **kwargs
         )
 
     def create_new_version(self) -> Version:
@@ -176,12 +165,3 @@ class AutoSelectVersionModifier(
         new_version: Optional[Version] = self.derive_next_version()
 
         return new_version or self.current_version
-
-    @classmethod
-    def get_allowed_arguments(cls) -> set[str]:
-        """"""
-        return {"vcs_provider"}.union(VersionModifier.get_allowed_arguments())
-
-    @cached_property
-    def _version_policy(self) -> VersionPolicy:
-        return SemanticVersionPolicy(self.current_version)
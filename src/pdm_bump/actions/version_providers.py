@@ -12,15 +12,14 @@
 """"""
 
 from abc import ABC, abstractmethod
-from enum import IntEnum
-from functools import cached_property
-from typing import Optional, Union, cast
+from logging import DEBUG
+from typing import Final, Optional
 
 from pdm_pfsc.logging import logger
 
 from ..core.version import Pep440VersionFormatter, Version
 from ..vcs import CommitStatistics, CommitType
-from .base import VersionModifier
+from .base import VersionModifier, VersionPersister
 from .increment import (
     DevelopmentVersionIncrementingVersionModifier,
     EpochIncrementingVersionModifier,
@@ -33,30 +32,41 @@ from .increment import (
 from .poetry_like import PoetryLikePreReleaseVersionModifier
 from .preview import PreReleaseIncrementingVersionModifier
 
+_formatter = Pep440VersionFormatter()
+
 
 class _NoopVersionModifier(VersionModifier):
+    def __init__(
+        self, version: Version, persister: "VersionPersister", **kwargs
+    ) -> None:
+        super().__init__(version, persister, **kwargs)
+        self._v: Version = version
+
     def create_new_version(self) -> Version:
-        return self.current_version
+        return self._v
 
 
-class Rating(IntEnum):
+# Justification: Plain namespace of integer constants
+class Rating:  # pylint: disable=R0903
     """"""
 
-    UNDEFINED = (0,)
-    NOOP = (10,)
-    LOCAL = (20,)
-    DEVELOPMENT = 30
-    POST = (40,)
-    PRERELEASE = 50
-    MICRO = 60
-    MINOR = 70
-    MAJOR = 80
-    EPOCH = 90
+    UNDEFINED: "Final[int]" = 0
+    NOOP: "Final[int]" = 10
+    LOCAL: "Final[int]" = 20
+    DEVELOPMENT: "Final[int]" = 30
+    POST: "Final[int]" = 40
+    PRERELEASE: "Final[int]" = 50
+    MICRO: "Final[int]" = 60
+    MINOR: "Final[int]" = 70
+    MAJOR: "Final[int]" = 80
+    EPOCH: "Final[int]" = 90
 
 
 class VersionPolicy(ABC):
     """"""
 
+    __slots__ = ("__version",)
+
     def __init__(self, version: Version) -> None:
         """"""
         self.__version = version
@@ -70,8 +80,9 @@ class VersionPolicy(ABC):
 
     def save_version(self, version: Version) -> None:
         """"""
-        version_formatted: str = Pep440VersionFormatter().format(version)
-        logger.debug("Would save version %s", version_formatted)
+        if logger.isEnabledFor(DEBUG):
+            version_formatted: str = _formatter.format(version)
+            logger.debug("Would save version %s", version_formatted)
 
     @property
     def _version(self) -> Version:
@@ -81,6 +92,8 @@ class VersionPolicy(ABC):
 class RatingBasedVersionPolicy(VersionPolicy):
     """"""
 
+    __slots__ = ("__version",)
+
     def __init__(self, version: Version) -> None:
         """"""
         super().__init__(version)
@@ -128,45 +141,45 @@ class RatingBasedVersionPolicy(VersionPolicy):
 
     def _get_max_rating(self, statistics, is_clean_repository) -> int:
         """"""
+        current_rating: int
+        if logger.isEnabledFor(DEBUG):
+            for commit_type, count in statistics.commit_type_count.items():
+                logger.debug(
+                    "Found %i commit(s) of type %s rated as %s",
+                    count,
+                    commit_type.name,
+                    self._rate_commit_type(commit_type),
+                )
+
         max_rating: int = -1
-        current_rating: Union[Rating, int]
-        for commit_type, count in statistics.commit_type_count.items():
-            current_rating = self._rate_commit_type(commit_type)
+        if statistics.contains_breaking_changes:
+            current_rating = self._rate_breaking_change()
             logger.debug(
-                "Found %i commit(s) of type %s rated as %s",
-                count,
-                commit_type.name,
+                "Found at least one breaking change rated as %s",
                 current_rating,
             )
-
-            if isinstance(current_rating, Rating):
-                current_rating = current_rating.value
-            current_rating = cast("int", current_rating)
-            max_rating = max(max_rating, current_rating)
+            max_rating = current_rating
+
+        # No commit can raise the rating beyond the ceiling,
+        # so stop as soon as it has been reached
+        ceiling: int = self._highest_commit_type_rating
+        if max_rating < ceiling:
+            for commit_type in statistics.distinct_types:
+                max_rating = max(
+                    max_rating, self._rate_commit_type(commit_type)
+                )
+                if max_rating >= ceiling:
+                    break
 
         logger.debug(
             "After evaluating all commits, the rating is set to %i", max_rating
         )
 
-        if statistics.contains_breaking_changes:
-            current_rating = self._rate_breaking_change()
-            logger.debug(
-                "Found at least one breaking change rated as %s",
-                current_rating,
-            )
-            if isinstance(current_rating, Rating):
-                current_rating = current_rating.value
-            current_rating = cast("int", current_rating)
-            max_rating = max(max_rating, current_rating)
-
         if not is_clean_repository:
             current_rating = self._rate_dirty_repository()
             logger.debug(
                 "Running on a dirty repository rated as %s", current_rating
             )
-            if isinstance(current_rating, Rating):
-                current_rating = current_rating.value
-            current_rating = cast("int", current_rating)
             max_rating = max(max_rating, current_rating)
 
         logger.debug("Rating set to %i", max_rating)
@@ -217,16 +230,21 @@ class RatingBasedVersionPolicy(VersionPolicy):
             return pre_release_part[0]
         return "alpha"
 
+    @property
+    def _highest_commit_type_rating(self) -> int:
+        """"""
+        return Rating.EPOCH
+
     @abstractmethod
-    def _rate_commit_type(self, c_type: CommitType) -> Union[Rating, int]:
+    def _rate_commit_type(self, c_type: CommitType) -> int:
         """"""
         raise NotImplementedError()
 
-    def _rate_breaking_change(self) -> Union[Rating, int]:
+    def _rate_breaking_change(self) -> int:
         """"""
         return Rating.MAJOR
 
-    def _rate_dirty_repository(self) -> Union[Rating, int]:
+    def _rate_dirty_repository(self) -> int:
         """"""
         return Rating.LOCAL
 
@@ -234,6 +252,14 @@ class RatingBasedVersionPolicy(VersionPolicy):
 class SetBasedVersionPolicy(RatingBasedVersionPolicy):
     """"""
 
+    __slots__ = ("__type_to_rating", "__highest_rating")
+
+    def __init__(self, version: Version) -> None:
+        """"""
+        super().__init__(version)
+        self.__type_to_rating: Optional[dict[CommitType, int]] = None
+        self.__highest_rating: Optional[int] = None
+
     @property
     @abstractmethod
     def epoch_increments(self) -> frozenset[CommitType]:
@@ -276,76 +302,81 @@ class SetBasedVersionPolicy(RatingBasedVersionPolicy):
         """"""
         raise NotImplementedError()  # pylint: disable=R0801
 
-    def _rate_commit_type(self, c_type: CommitType) -> Union[Rating, int]:
-        rating: Rating = Rating.NOOP
+    @property
+    def _rating_precedence(
+        self,
+    ) -> tuple[tuple[frozenset[CommitType], int], ...]:
+        """"""
+        # Ordered by precedence, the first matching set wins
+        return (
+            (self.epoch_increments, Rating.EPOCH),
+            (self.major_increments, Rating.MAJOR),
+            (self.minor_increments, Rating.MINOR),
+            (self.micro_increments, Rating.MICRO),
+            (self.post_increments, Rating.POST),
+            (self.dev_increments, Rating.DEVELOPMENT),
+            (self.local_increments, Rating.LOCAL),
+        )
 
-        if c_type in self.epoch_increments:
-            rating = Rating.EPOCH
-        elif c_type in self.major_increments:
-            rating = Rating.MAJOR
-        elif c_type in self.minor_increments:
-            rating = Rating.MINOR
-        elif c_type in self.micro_increments:
-            rating = Rating.MICRO
-        elif c_type in self.post_increments:
-            rating = Rating.POST
-        elif c_type in self.dev_increments:
-            rating = Rating.DEVELOPMENT
-        elif c_type in self.local_increments:
-            rating = Rating.LOCAL
+    @property
+    def _type_to_rating(self) -> dict[CommitType, int]:
+        """"""
+        if self.__type_to_rating is None:
+            type_to_rating: dict[CommitType, int] = {}
+            for commit_types, rating in self._rating_precedence:
+                for commit_type in commit_types:
+                    type_to_rating.setdefault(commit_type, rating)
+            self.__type_to_rating = type_to_rating
 
-        return rating
+        return self.__type_to_rating
 
+    @property
+    def _highest_commit_type_rating(self) -> int:
+        """"""
+        if self.__highest_rating is None:
+            self.__highest_rating = max(
+                self._type_to_rating.values(), default=Rating.NOOP
+            )
 
-class SemanticVersionPolicy(SetBasedVersionPolicy):
-    """"""
+        return self.__highest_rating
 
-    @cached_property
-    def epoch_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset()
+    def _rate_commit_type(self, c_type: CommitType) -> int:
+        return self._type_to_rating.get(c_type, Rating.NOOP)
 
-    @cached_property
-    def major_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset()
 
-    @cached_property
-    def minor_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset(
-            (
-                CommitType.Feature,
-                CommitType.Performance,
-                CommitType.Refactoring,
-            )
-        )
+_NO_TYPES: "Final[frozenset[CommitType]]" = frozenset()
+_SEMANTIC_MINOR_TYPES: "Final[frozenset[CommitType]]" = frozenset(
+    (
+        CommitType.Feature,
+        CommitType.Performance,
+        CommitType.Refactoring,
+    )
+)
+_SEMANTIC_MICRO_TYPES: "Final[frozenset[CommitType]]" = frozenset(
+    (CommitType.Bugfix, CommitType.Chore, CommitType.Documentation)
+)
+_SEMANTIC_POST_TYPES: "Final[frozenset[CommitType]]" = frozenset(
+    (
+        CommitType.Build,
+        CommitType.CodeStyle,
+        CommitType.ContinuousIntegration,
+        CommitType.Test,
+    )
+)
+_SEMANTIC_DEV_TYPES: "Final[frozenset[CommitType]]" = frozenset(
+    (CommitType.Undefined,)
+)
 
-    @cached_property
-    def micro_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset(
-            (CommitType.Bugfix, CommitType.Chore, CommitType.Documentation)
-        )
 
-    @cached_property
-    def post_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset(
-            (
-                CommitType.Build,
-                CommitType.CodeStyle,
-                CommitType.ContinuousIntegration,
-                CommitType.Test,
-            )
-        )
+class SemanticVersionPolicy(SetBasedVersionPolicy):
+    """"""
 
-    @cached_property
-    def dev_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset((CommitType.Undefined,))
+    __slots__ = ()
 
-    @cached_property
-    def local_increments(self) -> frozenset[CommitType]:
-        """"""
-        return frozenset()
+    epoch_increments: frozenset[CommitType] = _NO_TYPES
+    major_increments: frozenset[CommitType] = _NO_TYPES
+    minor_increments: frozenset[CommitType] = _SEMANTIC_MINOR_TYPES
+    micro_increments: frozenset[CommitType] = _SEMANTIC_MICRO_TYPES
+    post_increments: frozenset[CommitType] = _SEMANTIC_POST_TYPES
+    dev_increments: frozenset[CommitType] = _SEMANTIC_DEV_TYPES
+    local_increments: frozenset[CommitType] = _NO_TYPES
@@ -19,49 +19,49 @@ from .plugin import BumpCommand as _Command
 if TYPE_CHECKING:
     from pdm.project.config import ConfigItem as _ConfigItem
 
+    # Protocol is only needed for static type checks
+    class _CoreLike(Protocol):
+        """"""
 
-class _CoreLike(Protocol):
-    """"""
+        def register_command(
+            self, command: type[_Command], name: Optional[str] = None
+        ) -> None:
+            """
 
-    def register_command(
-        self, command: type[_Command], name: Optional[str] = None
-    ) -> None:
-        """
+            Parameters
+            ----------
+            command: type[_Command] :
 
-        Parameters
-        ----------
-        command: type[_Command] :
+            name: Optional[str] :
+                 (Default value = None)
 
-        name: Optional[str] :
-             (Default value = None)
+            Returns
+            -------
 
-        Returns
-        -------
+            """
+            # Method empty: Only a protocol stub
+            raise NotImplementedError()
 
-        """
-        # Method empty: Only a protocol stub
-        raise NotImplementedError()
+        @staticmethod
+        def add_config(name: str, config_item: "_ConfigItem") -> None:
+            """
 
-    @staticmethod
-    def add_config(name: str, config_item: "_ConfigItem") -> None:
-        """
+            Parameters
+            ----------
+            name: str :
 
-        Parameters
-        ----------
-        name: str :
+            config_item: _ConfigItem :
 
-        config_item: _ConfigItem :
 
+            Returns
+            -------
 
-        Returns
-        -------
+            """
+            # Method empty: Only a protocol stub
+            raise NotImplementedError()
 
-        """
-        # Method empty: Only a protocol stub
-        raise NotImplementedError()
 
-
-def main(core: _CoreLike) -> None:
+def main(core: "_CoreLike") -> None:
     """
 
     Parameters
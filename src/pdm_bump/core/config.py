@@ -10,7 +10,6 @@
 # Refer to LICENSE for more information
 #
 """"""
-from enum import Enum
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Final, Optional, Protocol
 
@@ -41,22 +40,17 @@ class _SupportsAddConfigItems(Protocol):  # pylint: disable=R0903
         raise NotImplementedError()
 
 
-class _StringEnum(str, Enum):
+# Justification: Plain namespace of string constants
+class _ConfigKeys:  # pylint: disable=R0903
     """"""
 
-    # Justification: Zen of python: Explicit is better than implicit
-    pass  # pylint: disable=W0107
-
-
-class _ConfigKeys(_StringEnum):
-    """"""
-
-    VERSION = "version"
-    VERSION_SOURCE = "source"
-    VERSION_SOURCE_FILE_PATH = "path"
-    BUILD_BACKEND = "build-backend"
-    VCS_PROVIDER = "provider"
-    PROJECT_METADATA = "project"
+    VERSION: "Final[str]" = "version"
+    VERSION_SOURCE: "Final[str]" = "source"
+    VERSION_SOURCE_FILE_PATH: "Final[str]" = "path"
+    BUILD_BACKEND: "Final[str]" = "build-backend"
+    VCS_PROVIDER: "Final[str]" = "provider"
+    PROJECT_METADATA: "Final[str]" = "project"
+    DYNAMIC: "Final[str]" = "dynamic"
 
 
 VERSION_CONFIG_KEY_NAME: "Final[str]" = _ConfigKeys.VERSION
@@ -73,18 +67,28 @@ ALLOW_DIRTY_DEFAULT: "Final[bool]" = False
 VCS_PROVIDER_DEFAULT: "Final[str]" = "git-cli"
 
 
-class _ConfigValues(_StringEnum):
+# Justification: Plain namespace of string constants
+class _ConfigValues:  # pylint: disable=R0903
     """"""
 
-    VERSION_SOURCE_FILE = "file"
-    VERSION_SOURCE_SCM = "scm"
-    DEPRECATED_BUILD_BACKEND_PDM_PEP517_API = "pdm.pep517.api"
-    BUILD_BACKEND_PDM_BACKEND = "pdm.backend"
+    VERSION_SOURCE_FILE: "Final[str]" = "file"
+    VERSION_SOURCE_SCM: "Final[str]" = "scm"
+    DEPRECATED_BUILD_BACKEND_PDM_PEP517_API: "Final[str]" = "pdm.pep517.api"
+    BUILD_BACKEND_PDM_BACKEND: "Final[str]" = "pdm.backend"
 
 
 class PdmBumpConfig:
     """"""
 
+    __slots__ = (
+        "__vcs_provider",
+        "__commit_msg_tpl",
+        "__perform_commit",
+        "__auto_tag",
+        "__tag_add_prefix",
+        "__allow_dirty",
+    )
+
     def __init__(self, accessor: "_PdmBumpConfigAccessor") -> None:
         namespace = accessor.values
         self.__vcs_provider: str = namespace.vcs_provider
@@ -128,36 +132,29 @@ class PdmBumpConfig:
         self, args: "argparse.Namespace"
     ) -> "argparse.Namespace":
         """"""
-
-        args = PdmBumpConfig.__update_args(args, "commit", self.perform_commit)
-        args = PdmBumpConfig.__update_args(
-            args, "commit_message", self.commit_msg_tpl
-        )
-        args = PdmBumpConfig.__update_args(args, "tag", self.auto_tag)
-        args = PdmBumpConfig.__update_args(args, "dirty", self.tag_allow_dirty)
-        args = PdmBumpConfig.__update_args(
-            args, "prepend_letter_v", self.tag_add_prefix
-        )
-
-        return args
-
-    @staticmethod
-    def __update_args(
-        ns: "argparse.Namespace", key: str, value: Any
-    ) -> "argparse.Namespace":
-        if key not in ns:
-            setattr(ns, key, value)
-        else:
-            stored_value: Optional[Any] = getattr(ns, key)
+        # The namespace stores its attributes in a plain dict
+        values: dict[str, Any] = vars(args)
+        for key, value in (
+            ("commit", self.perform_commit),
+            ("commit_message", self.commit_msg_tpl),
+            ("tag", self.auto_tag),
+            ("dirty", self.tag_allow_dirty),
+            ("prepend_letter_v", self.tag_add_prefix),
+        ):
+            if key not in values:
+                values[key] = value
+                continue
+
+            stored_value: Optional[Any] = values[key]
             if stored_value is None and value is not None:
-                setattr(ns, key, value)
+                values[key] = value
             elif isinstance(stored_value, IsMissing):
                 if value is None:
-                    setattr(ns, key, stored_value.raw_value())
+                    values[key] = stored_value.raw_value()
                 else:
-                    setattr(ns, key, value)
+                    values[key] = value
 
-        return ns
+        return args
 
 
 class _PdmBackendConfig:
@@ -169,24 +166,28 @@ class _PdmBackendConfig:
             ConfigSection.TOOL_CONFIG
         )
 
-    @property
-    def use_scm(self) -> bool:
+    @cached_property
+    def version_source(self) -> "Optional[str]":
         """"""
-        return (
-            self.__mapping.get_config_value(
-                _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE
-            )
-            == _ConfigValues.VERSION_SOURCE_SCM
+        return self.__mapping.get_config_value(
+            _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE
         )
 
-    @property
+    @cached_property
+    def use_scm(self) -> bool:
+        """"""
+        return self.version_source == _ConfigValues.VERSION_SOURCE_SCM
+
+    @cached_property
     def use_file(self) -> bool:
         """"""
-        return (
-            self.__mapping.get_config_value(
-                _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE
-            )
-            == _ConfigValues.VERSION_SOURCE_FILE
+        return self.version_source == _ConfigValues.VERSION_SOURCE_FILE
+
+    @cached_property
+    def version_source_file(self) -> "Optional[str]":
+        """"""
+        return self.__mapping.get_config_value(
+            _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE_FILE_PATH
         )
 
 
@@ -195,33 +196,26 @@ class _BuildSystemConfig:
 
     def __init__(self, accessor: "ConfigAccessor") -> None:
         """"""
-        self.__accessor = accessor
         self.__mapping = accessor.get_pyproject_config(
             ConfigSection.BUILD_SYSTEM
         )
-        self.__tool_mapping = accessor.get_pyproject_config(
-            ConfigSection.TOOL_CONFIG
-        )
         self.__backend = _PdmBackendConfig(accessor)
 
-    @property
+    @cached_property
     def build_backend(self) -> str:
         """"""
         return self.__mapping.get_config_value(_ConfigKeys.BUILD_BACKEND)
 
-    @property
+    @cached_property
     def uses_deprecated_build_backed_pdm_pep517(self) -> bool:
         """"""
         return (
             self.build_backend
             == _ConfigValues.DEPRECATED_BUILD_BACKEND_PDM_PEP517_API
-            and self.__accessor.get_pyproject_tool_config(
-                _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE
-            )
-            == _ConfigValues.VERSION_SOURCE_FILE
+            and self.__backend.use_file
         )
 
-    @property
+    @cached_property
     def uses_pdm_backend(self) -> bool:
         """"""
         return self.build_backend == _ConfigValues.BUILD_BACKEND_PDM_BACKEND
@@ -234,9 +228,7 @@ class _BuildSystemConfig:
     @property
     def version_source_file(self) -> "Optional[str]":
         """"""
-        return self.__tool_mapping.get_config_value(
-            _ConfigKeys.VERSION, _ConfigKeys.VERSION_SOURCE_FILE_PATH
-        )
+        return self.__backend.version_source_file
 
 
 class _MetaDataConfig:
@@ -257,10 +249,52 @@ class _MetaDataConfig:
         """"""
         return self.__build_system
 
-    @property
+    @cached_property
     def is_dynamic_version(self) -> bool:
         """"""
-        return _ConfigKeys.VERSION in self.__accessor.meta_data.dynamic
+        dynamic = self.__accessor.get_pyproject_metadata(_ConfigKeys.DYNAMIC)
+        return _ConfigKeys.VERSION in (dynamic or ())
+
+
+# name, description, default value, use environment variable
+_BUMP_CONFIG_ITEMS: "Final[tuple[tuple[str, str, Any, bool], ...]]" = (
+    (
+        "commit_msg_tpl",
+        "The default commit message. Uses templates 'from' and 'to'.",
+        COMMIT_MESSAGE_TEMPLATE_DEFAULT,
+        False,
+    ),
+    (
+        "perform_commit",
+        "If set to true, commit the bumped changes automatically",
+        PERFORM_COMMIT_DEFAULT,
+        False,
+    ),
+    (
+        "auto_tag",
+        "Create a tag after bumping and committing the changes",
+        AUTO_TAG_DEFAULT,
+        False,
+    ),
+    (
+        "tag_add_prefix",
+        "Adds the prefix v to the version tag",
+        TAG_ADD_PREFIX_DEFAULT,
+        False,
+    ),
+    (
+        "allow_dirty",
+        "Allows tagging the project, if it is dirty",
+        ALLOW_DIRTY_DEFAULT,
+        False,
+    ),
+    (
+        "vcs_provider",
+        "Configures the VCS Provider to use.",
+        VCS_PROVIDER_DEFAULT,
+        True,
+    ),
+)
 
 
 class _PdmBumpConfigAccessor(ConfigAccessor):
@@ -271,44 +305,13 @@ class _PdmBumpConfigAccessor(ConfigAccessor):
     ) -> None:
         super().__init__(config, cfg_holder)
         self.__items = ConfigItems(self)
-        self.__items.add_config_value(
-            "commit_msg_tpl",
-            description=(
-                "The default commit message. "
-                "Uses templates 'from' and 'to'."
-            ),
-            default=COMMIT_MESSAGE_TEMPLATE_DEFAULT,
-        )
-        self.__items.add_config_value(
-            "perform_commit",
-            description=(
-                "If set to true, commit the " "bumped changes automatically"
-            ),
-            default=PERFORM_COMMIT_DEFAULT,
-        )
-        self.__items.add_config_value(
-            "auto_tag",
-            description=(
-                "Create a tag after bumping " "and committing the changes"
-            ),
-            default=AUTO_TAG_DEFAULT,
-        )
-        self.__items.add_config_value(
-            "tag_add_prefix",
-            description="Adds the prefix v to the version tag",
-            default=TAG_ADD_PREFIX_DEFAULT,
-        )
-        self.__items.add_config_value(
-            "allow_dirty",
-            description="Allows tagging the project, if it is dirty",
-            default=ALLOW_DIRTY_DEFAULT,
-        )
-        self.__items.add_config_value(
-            "vcs_provider",
-            description="Configures the VCS Provider to use.",
-            default=VCS_PROVIDER_DEFAULT,
-            use_env_var=True,
-        )
+        for name, description, default, use_env_var in _BUMP_CONFIG_ITEMS:
+            self.__items.add_config_value(
+                name,
+                description=description,
+                default=default,
+                use_env_var=use_env_var,
+            )
 
     @property
     def plugin_config_name(self) -> "Iterable[str]":
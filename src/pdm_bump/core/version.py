@@ -20,7 +20,6 @@ from typing import Annotated, Any, Final, Literal, Optional, cast, final
 from annotated_types import Ge
 from packaging.version import InvalidVersion
 from packaging.version import Version as BaseVersion
-from pdm_pfsc.logging import traced_function
 
 
 @final
@@ -184,7 +183,7 @@ class Version:
         return my_data < other_data
 
     def __str__(self) -> str:
-        return Pep440VersionFormatter().format(self)
+        return _formatter.format(self)
 
     @staticmethod
     def default() -> "Version":
@@ -252,7 +251,6 @@ class Version:
 class Pep440VersionFormatter:  # pylint: disable=R0903
     """"""
 
-    @traced_function
     def format(self, version: "Version") -> str:
         """
 
@@ -285,3 +283,6 @@ class Pep440VersionFormatter:  # pylint: disable=R0903
             parts.append(f"+{version.local}")
 
         return "".join(parts)
+
+
+_formatter = Pep440VersionFormatter()
@@ -160,7 +160,7 @@ class BumpCommand(BaseCommand):
             return
 
         backend: "VersionSource" = cast("VersionSource", selected_backend)
-        vcs_provider: "VcsProvider" = self._get_vcs_provider(project)
+        vcs_provider: "VcsProvider" = self._get_vcs_provider(project, config)
 
         try:
             actions.execute(
@@ -179,19 +179,22 @@ class BumpCommand(BaseCommand):
             raise SystemExit(1) from exc
 
     @traced_function
-    def _get_vcs_provider(self, project: "_ProjectLike") -> VcsProvider:
+    def _get_vcs_provider(
+        self, project: "_ProjectLike", config: "Config"
+    ) -> VcsProvider:
         """
 
         Parameters
         ----------
         project: _ProjectLike :
 
+        config: Config :
+
 
         Returns
         -------
 
         """
-        config: "Config" = Config(project)
         value = config.pdm_bump.vcs_provider
 
         registry: "VcsProviderRegistry" = vcs_providers
@@ -83,13 +83,11 @@ class _VersionLine:
         )
 
     @property
-    @traced_function
     def version_group_name(self) -> str:
         """"""
         return self.__version_group_name
 
     @version_group_name.setter
-    @traced_function
     def version_group_name(self, value: str) -> None:
         """"""
         self.__version_group_name = value
@@ -191,13 +189,11 @@ class _VersionStorageBackend(VersionSource, ABC):
         raise NotImplementedError()  # pylint: disable=R0801
 
     @property
-    @traced_function
     def _config(self) -> "Config":
         """"""
         return self.__config
 
     @property
-    @traced_function
     def _repository_root(self) -> "Path":
         """"""
         return self.__repository_root
@@ -194,6 +194,9 @@ class VcsProviderAggregator:
     """"""
 
     def __init__(self, vcs_provider: "VcsProvider", **kwargs) -> None:
+        # Must precede the consumer it is mixed into in the bases, as the
+        # remaining keyword arguments are passed on along the MRO.
+        super().__init__(**kwargs)
         self.__vcs_provider: "VcsProvider" = vcs_provider
 
     @property
@@ -203,20 +203,21 @@ class GitCliVcsProvider(VcsProvider, CliRunnerMixin):
             logger.debug("Searching last tag ...")
             _, output, _ = self.run(
                 self.git_executable_path,
-                ("describe", "--tags"),
+                ("describe", "--tags", "--abbrev=0"),
                 raise_on_exit=False,
                 cwd=self.current_path,
             )
-            if output.strip() == "":
+            tag: str = output.strip()
+            if tag == "":
                 raise VcsProviderError("Failed to fetch most recent tag")
-            logger.debug("Found tag '%s'", output)
+            logger.debug("Found tag '%s'", tag)
             _, output, _ = self.run(
                 self.git_executable_path,
-                ("rev-list", f"{output}..HEAD", "--count"),
+                ("rev-list", f"{tag}..HEAD", "--count"),
                 raise_on_exit=True,
                 cwd=self.current_path,
             )
-            logger.debug("Git return %s changes", output)
+            logger.debug("Git return %s changes", output.strip())
 
             return int(output)
         except CalledProcessError as cpe:
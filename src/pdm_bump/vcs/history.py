@@ -174,6 +174,11 @@ class CommitStatistics:
     )
     contains_breaking_changes: bool = field(init=True, default=False)
 
+    @cached_property
+    def distinct_types(self) -> "frozenset[CommitType]":
+        """"""
+        return frozenset(self.commit_type_count)
+
 
 @dataclass(init=True, eq=True, order=True, repr=True, frozen=True)
 class History:
@@ -36,6 +36,11 @@ from pdm_bump.actions.poetry_like import (
     PoetryLikePreMinorVersionModifier,
     PoetryLikePrePatchVersionModifier,
 )
+from pdm_bump.actions.vcs import (
+    AutoSelectVersionModifier,
+    CreateTagFromVersion,
+    SuggestNewVersion,
+)
 
 from pdm_bump.core.version import Version
 
@@ -979,3 +984,18 @@ def test_create_next_version_fail(message, current_version_str, factory, excepti
 
     with assert_raises(exception_type):
         _ = command.create_new_version()
+
+@parametrize(
+    ",".join(["action_type", "expected_arguments"]),
+    [
+        (CreateTagFromVersion, {"version", "vcs_provider"}),
+        (SuggestNewVersion, {"version", "vcs_provider"}),
+        (AutoSelectVersionModifier, {"version", "persister", "vcs_provider"}),
+    ],
+)
+def test_vcs_allowed_arguments(action_type, expected_arguments) -> None:
+    allowed_arguments: set[str] = action_type.get_allowed_arguments()
+    assert expected_arguments <= allowed_arguments
+
+    allowed_arguments.add("unknown")
+    assert "unknown" not in action_type.get_allowed_arguments()
@@ -0,0 +1,49 @@
+#
+# SPDX-License-Identifier: MIT
+#
+# Copyright (c) 2021-2023 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+# This file is published using the MIT license.
+# Refer to LICENSE for more information
+#
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from pdm_bump.core.config import Config
+
+import pytest
+
+parametrize = pytest.mark.parametrize
+
+
+class _ProjectStub:
+    PYPROJECT_FILENAME: str = "pyproject.toml"
+
+    def __init__(self, root: Path) -> None:
+        self.root: Path = root
+        self.config: Mapping[str, Any] = {}
+
+
+@parametrize(
+    ",".join(["project_table", "expected"]),
+    [
+        ('name = "demo"\nversion = "1.0.0"\n', False),
+        ('name = "demo"\ndynamic = ["version"]\n', True),
+        ('name = "demo"\nversion = "1.0.0"\ndynamic = ["readme"]\n', False),
+    ],
+)
+def test_is_dynamic_version(
+    tmp_path: Path, project_table: str, expected: bool
+) -> None:
+    (tmp_path / _ProjectStub.PYPROJECT_FILENAME).write_text(
+        f"[project]\n{project_table}", encoding="utf-8"
+    )
+
+    config = Config(_ProjectStub(tmp_path))
+
+    assert config.meta_data.is_dynamic_version == expected
@@ -0,0 +1,84 @@
+#
+# SPDX-License-Identifier: MIT
+#
+# Copyright (c) 2021-2023 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+# This file is published using the MIT license.
+# Refer to LICENSE for more information
+#
+
+from collections.abc import Generator
+from pathlib import Path
+from shutil import which
+from subprocess import run
+
+from pdm_bump.vcs.core import VcsProviderError
+from pdm_bump.vcs.gitcli import GitCliVcsProvider
+
+import pytest
+
+assert_raises = pytest.raises
+fixture = pytest.fixture
+
+pytestmark = pytest.mark.skipif(
+    which("git") is None, reason="git executable is not available"
+)
+
+
+def _git(path: Path, *args: str) -> None:
+    run(
+        (
+            "git",
+            "-c",
+            "user.name=pdm-bump",
+            "-c",
+            "user.email=pdm-bump@example.com",
+            "-c",
+            "commit.gpgSign=false",
+            "-c",
+            "tag.gpgSign=false",
+            *args,
+        ),
+        cwd=path,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(path: Path, message: str) -> None:
+    _git(path, "commit", "--allow-empty", "-m", message)
+
+
+@fixture
+def repository(tmp_path: Path) -> Generator[Path, None, None]:
+    _git(tmp_path, "init")
+    _commit(tmp_path, "chore: Initial commit")
+    yield tmp_path
+
+
+def test_number_of_changes_since_last_release(repository: Path) -> None:
+    _git(repository, "tag", "v1.0.0")
+    _commit(repository, "fix: Fix a bug")
+    _commit(repository, "feat: Add a feature")
+
+    provider = GitCliVcsProvider(repository)
+
+    assert provider.get_number_of_changes_since_last_release() == 2
+
+
+def test_number_of_changes_on_tagged_revision(repository: Path) -> None:
+    _git(repository, "tag", "v1.0.0")
+
+    provider = GitCliVcsProvider(repository)
+
+    assert provider.get_number_of_changes_since_last_release() == 0
+
+
+def test_number_of_changes_without_tag(repository: Path) -> None:
+    provider = GitCliVcsProvider(repository)
+
+    with assert_raises(VcsProviderError):
+        provider.get_number_of_changes_since_last_release()
@@ -0,0 +1,75 @@
+#
+# SPDX-License-Identifier: MIT
+#
+# Copyright (c) 2021-2023 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+# This file is published using the MIT license.
+# Refer to LICENSE for more information
+#
+
+from argparse import Namespace
+from typing import Optional
+
+from pdm_bump.actions.hook import PostHookContext, PreHookContext, TagChanges
+from pdm_bump.core.version import Version
+
+import pytest
+
+parametrize = pytest.mark.parametrize
+
+
+class _VcsProviderStub:
+    def __init__(self) -> None:
+        self.is_clean: bool = True
+        self.tagged_version: Optional[Version] = None
+        self.tagged_with_prefix: Optional[bool] = None
+
+    def create_tag_from_version(
+        self, version: Version, prepend_letter_v: bool = True
+    ) -> None:
+        self.tagged_version = version
+        self.tagged_with_prefix = prepend_letter_v
+
+
+@parametrize(
+    "prepend_letter_v,expected_prefix",
+    [
+        (True, True),
+        (False, False),
+        ("false", False),
+    ],
+)
+def test_tag_changes_hooks_share_flags(
+    prepend_letter_v, expected_prefix
+) -> None:
+    vcs_provider = _VcsProviderStub()
+    old_version = Version.from_string("1.0.0")
+    new_version = Version.from_string("1.0.1")
+    args = Namespace(tag=True, dirty=False, prepend_letter_v=prepend_letter_v)
+    hook = TagChanges()
+
+    hook.pre_action_hook(PreHookContext(vcs_provider, old_version), args)
+    # Remove the flags, so that the post hook can only see the resolved ones
+    args = Namespace()
+    hook.post_action_hook(
+        PostHookContext(vcs_provider, None, new_version, old_version, True),
+        args,
+    )
+
+    assert vcs_provider.tagged_version == new_version
+    assert vcs_provider.tagged_with_prefix == expected_prefix
+
+
+def test_tag_changes_pre_hook_rejects_dirty_repository() -> None:
+    vcs_provider = _VcsProviderStub()
+    vcs_provider.is_clean = False
+    args = Namespace(tag="true", dirty="false", prepend_letter_v=True)
+    hook = TagChanges()
+
+    with pytest.raises(RuntimeError):
+        hook.pre_action_hook(
+            PreHookContext(vcs_provider, Version.from_string("1.0.0")), args
+        )